@@ -1,8 +1,28 @@
+import itertools
 import os
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import streamlit as st
 import altair as alt
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pyuring
+except ImportError:
+    pyuring = None
+
 BASE_PATH = "cricket/analysis"
 SUBFOLDERS = {
     "all_json": "All International Matches",
@@ -12,175 +32,585 @@ SUBFOLDERS = {
     "t20s_json": "T20 International Matches",
     "tests_json": "Test Matches"
 }
+# ballbyball/ parquet datasets are hive-partitioned on match_id % BALL_BUCKETS
+BALL_BUCKETS = 64
+RUN_VALUES = [0, 1, 2, 3, 4, 6]
+# written by scripts/precompute.py, one per (folder, team)
+SNAPSHOT_FILE = "summary.pkl"
+# ETL outputs whose mtimes key the cached loaders and aggregations
+ETL_FILES = ["{folder}_matches.csv", "matches.csv", "info_summary.csv", "ballbyball.csv", "players.parquet"]
+# bounds for the mtime-keyed caches, so frames from earlier ETL runs are evicted
+FRAME_CACHE_ENTRIES = 32
+SECTION_CACHE_ENTRIES = 256
+
+# Arrow types for the dtype names used in the *_DTYPES specs below
+ARROW_TYPES = {"int64": pa.int64(), "int8": pa.int8(), "category": pa.dictionary(pa.int32(), pa.string())}
+BALL_DTYPES = {
+    "match_id": "int64",
+    "runs_batter": "int8",
+    "runs_extras": "int8",
+    "runs_total": "int8",
+    "wicket_type": "category",
+    "extras_type": "category"
+}
+INFO_DTYPES = {"match_id": "int64", "toss_winner": "category", "toss_decision": "category"}
+MATCH_DTYPES = {"outcome.winner": "category", "player_of_match": "category"}
+MATCH_COLUMNS = [
+    "match_id", "teams", "team_a", "team_b", "player_of_match",
+    "outcome.winner", "outcome.by.wickets", "outcome.by.runs", "outcome.result"
+]
+BATTER_DTYPES = {"match_id": "int64", "runs_batter": "int8"}
+WICKET_DTYPES = {"match_id": "int64", "wicket_type": "category"}
+PLAYER_COLUMNS = ["player", "match_id", "runs_batter", "wicket_type", "role"]
+PLAYER_ROLES = {"batter": BATTER_DTYPES, "bowler": WICKET_DTYPES, "fielder": WICKET_DTYPES}
+PLAYER_ARROW_TYPES = {"match_id": pa.int64(), "runs_batter": pa.int16(), "wicket_type": pa.string()}
+# player CSVs are prefetched through io_uring on Linux when pyuring is installed
+USE_URING = pyuring is not None and sys.platform == "linux"
+URING_DEPTH = 64
+# player/<name>/<role>.csv -> the folder name becomes the "player" column
+PLAYER_PARTITIONING = ds.DirectoryPartitioning(pa.schema([("player", pa.string())]), segment_encoding="none")
 
 # ---------- Helpers ----------
-def load_csv(path):
-    if os.path.exists(path):
-        return pd.read_csv(path)
-    return pd.DataFrame()
+def arrow_dtype(pa_type):
+    # Keep columns Arrow-backed; dictionary columns convert to pandas categoricals
+    if pa.types.is_dictionary(pa_type):
+        return None
+    return pd.ArrowDtype(pa_type)
 
-def get_teams(folder):
-    team_dir = os.path.join(BASE_PATH, folder, "team")
-    if os.path.exists(team_dir):
-        return [d for d in os.listdir(team_dir) if os.path.isdir(os.path.join(team_dir, d))]
-    return []
+def arrow_to_pandas(table):
+    df = table.to_pandas(types_mapper=arrow_dtype, self_destruct=True)
+    # Arrow dictionaries are in first-seen order; sort so groupby output stays alphabetical
+    for col in df.select_dtypes("category").columns:
+        df[col] = df[col].cat.reorder_categories(df[col].cat.categories.sort_values())
+    return df
 
-def get_players(folder, team=None):
-    player_dir = os.path.join(BASE_PATH, folder, "player")
-    if os.path.exists(player_dir):
-        return [d for d in os.listdir(player_dir) if os.path.isdir(os.path.join(player_dir, d))]
-    return []
+def mtime_ns(path):
+    # part of a cache key: changes whenever the ETL rewrites path, None while it is missing
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
-# ---------- Dashboard Renderer ----------
-def show_dashboard(folder, title, team=None):
-    st.header(f"📊 {title}" + (f" - {team}" if team else ""))
+def tree_mtime(path):
+    # newest mtime of a directory and its direct subdirectories (dataset partitions)
+    if not os.path.isdir(path):
+        return None
+    with os.scandir(path) as it:
+        return max([mtime_ns(path)] + [e.stat().st_mtime_ns for e in it if e.is_dir()])
+
+def player_csv_mtime(player_dir):
+    # newest per-player CSV; the notebook overwrites them in place, so no directory mtime moves
+    if not os.path.isdir(player_dir):
+        return None
+    newest = mtime_ns(player_dir)
+    with os.scandir(player_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                with os.scandir(entry.path) as sub:
+                    newest = max([newest] + [f.stat().st_mtime_ns for f in sub if f.name.endswith(".csv")])
+    return newest
+
+def etl_version(folder):
+    # passed to every cached loader/aggregation so a notebook rerun shows up on the next app rerun
+    folder_path = os.path.join(BASE_PATH, folder)
+    files = tuple(mtime_ns(os.path.join(folder_path, name.format(folder=folder))) for name in ETL_FILES)
+    version = files + (tree_mtime(os.path.join(folder_path, "ballbyball")),)
+    if files[ETL_FILES.index("players.parquet")] is None:
+        # load_players reads the per-player CSVs only when players.parquet is missing
+        version += (player_csv_mtime(os.path.join(folder_path, "player")),)
+    return version
+
+def load_csv(path, usecols=None, dtypes=None):
+    return _load_csv(path, mtime_ns(path), usecols, dtypes)
+
+@st.cache_data(show_spinner=False, max_entries=FRAME_CACHE_ENTRIES)
+def _load_csv(path, mtime, usecols=None, dtypes=None):
+    if mtime is None:
+        return pd.DataFrame()
+    if usecols is not None or dtypes:
+        # header only; json_normalize exports can have headers of several hundred KB
+        header = pd.read_csv(path, nrows=0).columns
+        if usecols is not None:
+            usecols = [c for c in usecols if c in header]
+            if not usecols:
+                # an empty include_columns would read every column
+                return pd.DataFrame()
+        if dtypes:
+            dtypes = {c: t for c, t in dtypes.items() if c in header and (usecols is None or c in usecols)}
+    convert_options = pacsv.ConvertOptions(
+        include_columns=usecols or [],
+        column_types={c: ARROW_TYPES[t] for c, t in (dtypes or {}).items()},
+        strings_can_be_null=True
+    )
+    return arrow_to_pandas(pacsv.read_csv(path, convert_options=convert_options))
+
+def list_subdirs(path):
+    # adding or removing a subdirectory changes the parent's mtime
+    return _list_subdirs(path, mtime_ns(path))
+
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def _list_subdirs(path, mtime):
+    # scandir reuses the dirent type, so no extra stat per entry
+    if mtime is None or not os.path.isdir(path):
+        return []
+    with os.scandir(path) as it:
+        return [e.name for e in it if e.is_dir()]
+
+def scan_player_files(player_dir):
+    # {role: [csv path]} from one scandir per player folder, no per-file exists()
+    roles = {role: [] for role in PLAYER_ROLES}
+    if not os.path.isdir(player_dir):
+        return roles
+    with os.scandir(player_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as sub:
+                names = {f.name: f.path for f in sub}
+            for role in roles:
+                path = names.get(f"{role}.csv")
+                if path:
+                    roles[role].append(path)
+    return roles
+
+def uring_read_files(ring, paths):
+    # (index, buffer) in completion order, keeping up to URING_DEPTH reads in flight
+    inflight = {}
+    queued = iter(enumerate(paths))
+    try:
+        while True:
+            for i, path in itertools.islice(queued, URING_DEPTH - len(inflight)):
+                fd = os.open(path, os.O_RDONLY)
+                buf = bytearray(os.fstat(fd).st_size)
+                inflight[i] = (fd, buf)
+                ring.read_async(fd, buf, offset=0, user_data=i)
+            if not inflight:
+                return
+            ring.submit()
+            i, result = ring.wait_completion()
+            fd, buf = inflight.pop(i)
+            try:
+                if result < 0:
+                    raise OSError(-result, os.strerror(-result), paths[i])
+                while result < len(buf):
+                    # short read; finish the file synchronously
+                    chunk = os.pread(fd, len(buf) - result, result)
+                    if not chunk:
+                        break
+                    buf[result:result + len(chunk)] = chunk
+                    result += len(chunk)
+            finally:
+                os.close(fd)
+            yield i, pa.py_buffer(buf)[:result]
+    finally:
+        for fd, _ in inflight.values():
+            os.close(fd)
+
+def parse_player_csv(buf, path, convert_options):
+    # each file is small, so parse it single-threaded and spread files across the pool
+    table = pacsv.read_csv(
+        pa.BufferReader(buf), read_options=pacsv.ReadOptions(use_threads=False), convert_options=convert_options
+    )
+    player = os.path.basename(os.path.dirname(path))
+    return table.append_column("player", pa.repeat(player, table.num_rows))
 
-    ball_df = load_csv(os.path.join(BASE_PATH, folder, "ballbyball.csv"))
-    info_df = load_csv(os.path.join(BASE_PATH, folder, "info_summary.csv"))
-    matches_df = load_csv(os.path.join(BASE_PATH, folder, f"{folder}_matches.csv"))
+def read_player_csvs(paths, columns):
+    # One table for a role from io_uring-prefetched buffers, or None if no ring can be set up
+    try:
+        ring = pyuring.UringCtx(entries=URING_DEPTH)
+    except OSError:
+        # old kernel, seccomp or missing liburing; per-file read errors below still propagate
+        return None
+    convert_options = pacsv.ConvertOptions(
+        column_types={c: PLAYER_ARROW_TYPES[c] for c in columns},
+        strings_can_be_null=True,
+        include_columns=columns
+    )
+    # completions are parsed on the pool while the ring keeps the next reads in flight
+    with ring, ThreadPoolExecutor() as pool:
+        futures = [
+            (i, pool.submit(parse_player_csv, buf, paths[i], convert_options))
+            for i, buf in uring_read_files(ring, paths)
+        ]
+        tables = [None] * len(paths)
+        for i, future in futures:
+            tables[i] = future.result()
+    return pa.concat_tables(tables)
+
+@st.cache_data(show_spinner=False, max_entries=FRAME_CACHE_ENTRIES)
+def load_players(folder, version):
+    # players.parquet is built by the notebook ETL; fall back to the per-player CSVs
+    store = os.path.join(BASE_PATH, folder, "players.parquet")
+    if os.path.exists(store):
+        return pd.read_parquet(store, columns=PLAYER_COLUMNS, pre_buffer=True).astype({"wicket_type": "category"})
+
+    # One threaded Arrow CSV scan per role instead of one read_csv per file
     player_dir = os.path.join(BASE_PATH, folder, "player")
+    frames = []
+    for role, paths in scan_player_files(player_dir).items():
+        if not paths:
+            continue
+        columns = list(PLAYER_ROLES[role])
+        table = read_player_csvs(paths, columns) if USE_URING else None
+        if table is not None:
+            frames.append(table.to_pandas().assign(role=role))
+            continue
+        csv_format = ds.CsvFileFormat(convert_options=pacsv.ConvertOptions(
+            column_types={c: PLAYER_ARROW_TYPES[c] for c in columns},
+            strings_can_be_null=True
+        ))
+        dataset = ds.dataset(paths, format=csv_format, partitioning=PLAYER_PARTITIONING, partition_base_dir=player_dir)
+        frames.append(dataset.to_table(columns=columns + ["player"]).to_pandas().assign(role=role))
+    players = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    players = players.reindex(columns=PLAYER_COLUMNS)
+    return players.astype({"match_id": "int64", "runs_batter": "Int16", "wicket_type": "category"})
+
+def split_teams(teams):
+    # "A,B" from the notebook ETL or "['A', 'B']" from a json_normalize export
+    parts = teams.str.strip("[]").str.split(",", n=1, expand=True).reindex(columns=[0, 1])
+    return [parts[i].str.strip().str.strip("'\"") for i in (0, 1)]
+
+@st.cache_data(show_spinner=False, max_entries=FRAME_CACHE_ENTRIES)
+def load_matches(folder, version):
+    matches_df = load_csv(os.path.join(BASE_PATH, folder, f"{folder}_matches.csv"), MATCH_COLUMNS, MATCH_DTYPES)
+    if "team_a" not in matches_df.columns and "match_id" in matches_df.columns:
+        # the notebook ETL writes team_a/team_b to matches.csv; the export above may not have them
+        etl_teams = load_csv(os.path.join(BASE_PATH, folder, "matches.csv"), ["match_id", "team_a", "team_b"])
+        if {"team_a", "team_b"} <= set(etl_teams.columns):
+            matches_df = matches_df.merge(etl_teams, on="match_id", how="left")
+    if "teams" in matches_df.columns:
+        # parse the joined teams column for matches the ETL columns do not cover
+        team_a, team_b = split_teams(matches_df["teams"])
+        if "team_a" in matches_df.columns:
+            team_a, team_b = matches_df["team_a"].fillna(team_a), matches_df["team_b"].fillna(team_b)
+        matches_df["team_a"], matches_df["team_b"] = team_a, team_b
+    if "team_a" in matches_df.columns:
+        # shared categories so one integer code identifies a team in either column
+        teams = pd.CategoricalDtype(pd.unique(pd.concat([matches_df["team_a"], matches_df["team_b"]]).dropna()))
+        matches_df = matches_df.astype({"team_a": teams, "team_b": teams})
+    return matches_df
+
+def in_sorted(values, sorted_keys):
+    # Membership by binary search against pre-sorted keys, no hash table build
+    if len(sorted_keys) == 0:
+        return np.zeros(len(values), dtype=bool)
+    pos = np.searchsorted(sorted_keys, values).clip(max=len(sorted_keys) - 1)
+    return sorted_keys[pos] == values
+
+def filter_by_match(df, match_ids):
+    # match_ids is team_match_ids' sorted tuple, so membership is a binary search
+    if match_ids is None or df.empty:
+        return df
+    return df[in_sorted(df["match_id"].to_numpy(dtype="int64"), np.array(match_ids, dtype="int64"))]
+
+def load_ball(folder, match_ids=None):
+    # match_ids is a sorted tuple; only the partitions holding those matches are read.
+    # Not cached itself: ball_summary, its only caller, caches the aggregated result
+    dataset = os.path.join(BASE_PATH, folder, "ballbyball")
+    if not os.path.isdir(dataset):
+        ball_df = load_csv(os.path.join(BASE_PATH, folder, "ballbyball.csv"), list(BALL_DTYPES), BALL_DTYPES)
+        return filter_by_match(ball_df, match_ids)
+
+    filters = None
+    if match_ids is not None:
+        buckets = sorted({m % BALL_BUCKETS for m in match_ids})
+        filters = [("match_bucket", "in", buckets), ("match_id", "in", list(match_ids))]
+    table = pq.read_table(
+        dataset, columns=list(BALL_DTYPES), filters=filters,
+        read_dictionary=["wicket_type", "extras_type"], pre_buffer=True, use_threads=True
+    )
+    return arrow_to_pandas(table)
+
+def count_values(df, columns, labels=None):
+    # One Arrow table, one value_counts kernel per column; Arrow releases the GIL.
+    # Highest counts first, ties in first-appearance order, nulls dropped;
+    # labels maps a column to the (value, count) column names of its frame
+    if not columns:
+        return {}
+    table = pa.Table.from_pandas(df[columns], preserve_index=False)
+    labels = labels or {}
+
+    def count(col):
+        vc = pc.value_counts(table[col])
+        values, counts = vc.field("values"), vc.field("counts")
+        if pa.types.is_dictionary(values.type):
+            values = values.dictionary_decode()
+        valid = pc.is_valid(values)
+        value_name, count_name = labels.get(col, (col, "count"))
+        res = pd.DataFrame({value_name: values.filter(valid).to_pandas(), count_name: counts.filter(valid).to_pandas()})
+        return res.sort_values(count_name, ascending=False, kind="stable", ignore_index=True)
 
-    # --- Filter by team if selected ---
-    if team and not matches_df.empty:
-        team_matches = matches_df[matches_df["teams"].str.contains(team, na=False)]
-        valid_match_ids = team_matches["match_id"].unique()
-        ball_df = ball_df[ball_df["match_id"].isin(valid_match_ids)]
-        info_df = info_df[info_df["match_id"].isin(valid_match_ids)]
-        matches_df = matches_df[matches_df["match_id"].isin(valid_match_ids)]
+    with ThreadPoolExecutor(max_workers=len(columns)) as pool:
+        return dict(zip(columns, pool.map(count, columns)))
 
+def _ball_totals(runs_total, runs_extras, wicket_isnull):
+    # Single pass over the three columns instead of one reduction per metric
+    total_runs = total_extras = total_wickets = 0
+    for i in range(len(runs_total)):
+        total_runs += runs_total[i]
+        total_extras += runs_extras[i]
+        total_wickets += not wicket_isnull[i]
+    return total_runs, total_wickets, total_extras, len(runs_total)
+
+if njit is not None:
+    ball_totals = njit(cache=True)(_ball_totals)
+else:
+    def ball_totals(runs_total, runs_extras, wicket_isnull):
+        return int(runs_total.sum()), int(len(wicket_isnull) - wicket_isnull.sum()), int(runs_extras.sum()), len(runs_total)
+
+def get_teams(folder):
+    return list_subdirs(os.path.join(BASE_PATH, folder, "team"))
+
+def get_players(folder, team=None):
+    return list_subdirs(os.path.join(BASE_PATH, folder, "player"))
+
+# ---------- Section Aggregations ----------
+# Cached per (folder, team, etl_version) so a rerun only recomputes sections whose selection or data changed
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def team_matches(folder, team, version):
+    matches_df = load_matches(folder, version)
+    if not team or matches_df.empty:
+        return matches_df
+    # team folders are named with "_" in place of spaces
+    team_name = team.replace("_", " ")
+    code = matches_df["team_a"].cat.categories.get_indexer([team_name])[0]
+    if code < 0:
+        return matches_df.iloc[:0]
+    team_a = matches_df["team_a"].cat.codes.to_numpy()
+    team_b = matches_df["team_b"].cat.codes.to_numpy()
+    return matches_df[(team_a == code) | (team_b == code)]
+
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def team_match_ids(folder, team, version):
+    # sorted tuple of the team's match ids, or None when no team filter applies
+    if not team or load_matches(folder, version).empty:
+        return None
+    return tuple(np.sort(team_matches(folder, team, version)["match_id"].unique().to_numpy()).tolist())
+
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def ball_summary(folder, team, version):
+    ball_df = load_ball(folder, team_match_ids(folder, team, version))
     if ball_df.empty:
-        st.warning("No ball-by-ball data available for this selection.")
-        return
+        return None
+
+    counts = np.bincount(ball_df["runs_batter"].to_numpy(dtype=np.int8), minlength=7)
+    value_counts = count_values(ball_df, ["wicket_type", "extras_type"])
+    total_runs, total_wickets, total_extras, total_balls = ball_totals(
+        ball_df["runs_total"].to_numpy(dtype=np.int8),
+        ball_df["runs_extras"].to_numpy(dtype=np.int8),
+        ball_df["wicket_type"].isna().to_numpy()
+    )
+    totals = {
+        "Total Runs": total_runs,
+        "Total Wickets": total_wickets,
+        "Total Extras": total_extras,
+        "Total Balls": total_balls
+    }
+    return {
+        "runs": pd.DataFrame({"runs_batter": RUN_VALUES, "count": counts[RUN_VALUES]}),
+        "wickets": value_counts["wicket_type"],
+        "extras": value_counts["extras_type"],
+        "totals": pd.DataFrame(totals.items(), columns=["Metric","Value"])
+    }
+
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def player_leaders(folder, team, version):
+    players = filter_by_match(load_players(folder, version), team_match_ids(folder, team, version))
+
+    # Per-player totals in one groupby pass over the long-form player table
+    role = players["role"]
+    player_stats = players.assign(
+        runs=players["runs_batter"].where(role == "batter", 0),
+        wickets=players["wicket_type"].notna() & (role == "bowler")
+    ).groupby("player", sort=False, observed=True)[["runs", "wickets"]].sum()
+
+    # every (player, dismissal kind) count in one pass over the wicket_type codes
+    fielders = players[role == "fielder"]
+    dismissals = fielders.groupby(["player", "wicket_type"], sort=False, observed=True).size().unstack(fill_value=0)
+    fld_df = pd.DataFrame({
+        "catches": dismissals.get("caught", 0),
+        "runouts": dismissals.get("run out", 0)
+    }, index=dismissals.index)
+    fld_df = fld_df.assign(total=fld_df["catches"] + fld_df["runouts"]).nlargest(10, "total")
+
+    return {
+        "runs": player_stats["runs"].nlargest(10).reset_index(),
+        "wickets": player_stats["wickets"].nlargest(10).reset_index(),
+        "fielders": fld_df.reset_index()[["player", "total", "catches", "runouts"]]
+    }
+
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def toss_summary(folder, team, version):
+    info_df = load_csv(os.path.join(BASE_PATH, folder, "info_summary.csv"), list(INFO_DTYPES), INFO_DTYPES)
+    info_df = filter_by_match(info_df, team_match_ids(folder, team, version))
+    if info_df.empty:
+        return None
+
+    toss_counts = count_values(info_df, ["toss_winner"], {"toss_winner": ("team", "count")})["toss_winner"]
+    toss_decision_counts = None
+    if "toss_winner" in info_df.columns and "toss_decision" in info_df.columns:
+        toss_decision_counts = info_df.groupby(["toss_winner","toss_decision"], observed=True).size().reset_index(name="count")
+    return {"wins": toss_counts, "decisions": toss_decision_counts}
+
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def match_summary(folder, team, version):
+    matches_df = team_matches(folder, team, version)
+    summary = {"pom": None, "winners": None, "margins": None}
+    if matches_df.empty:
+        return summary
+
+    labels = {"player_of_match": ("player", "count"), "outcome.winner": ("team", "wins")}
+    counts = count_values(matches_df, [c for c in labels if c in matches_df.columns], labels)
+    summary["pom"] = counts.get("player_of_match")
+
+    if "outcome.winner" in counts:
+        summary["winners"] = counts["outcome.winner"]
+
+        if "outcome.by.wickets" in matches_df.columns or "outcome.by.runs" in matches_df.columns:
+            margin_df = matches_df[["outcome.winner","outcome.by.wickets","outcome.by.runs","outcome.result"]].dropna(how="all")
+            summary["margins"] = margin_df.head(20)  # preview only
+    return summary
+
+def build_snapshot(folder, team, version):
+    # every section a dashboard renders, or None when there is no ball-by-ball data
+    summary = ball_summary(folder, team, version)
+    if summary is None:
+        return None
+    return {
+        "ball": summary,
+        "leaders": player_leaders(folder, team, version),
+        "toss": toss_summary(folder, team, version),
+        "matches": match_summary(folder, team, version)
+    }
+
+def snapshot_path(folder, team=None):
+    if team:
+        return os.path.join(BASE_PATH, folder, "team", team, SNAPSHOT_FILE)
+    return os.path.join(BASE_PATH, folder, SNAPSHOT_FILE)
+
+def load_snapshot(folder, team, version):
+    # None when missing or built from older ETL output; "missing" is not cached,
+    # so a snapshot written while the app runs is picked up on the next rerun
+    path = snapshot_path(folder, team)
+    mtime = mtime_ns(path)
+    if mtime is None:
+        return None
+    snapshot = _read_snapshot(path, mtime)
+    if snapshot.get("version") != version:
+        return None
+    return snapshot["sections"]
 
+@st.cache_data(show_spinner=False, max_entries=SECTION_CACHE_ENTRIES)
+def _read_snapshot(path, mtime):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+# ---------- Dashboard Renderer ----------
+def render_ball_summary(summary):
     # Runs Distribution
     st.subheader("📊 Runs Distribution (0,1,2,3,4,6)")
-    runs_counts = ball_df["runs_batter"].value_counts().reindex([0,1,2,3,4,6], fill_value=0).reset_index()
-    runs_counts.columns = ["runs_batter", "count"]
-    st.altair_chart(alt.Chart(runs_counts).mark_arc().encode(theta="count:Q", color="runs_batter:N"))
-    st.table(runs_counts)
+    st.altair_chart(alt.Chart(summary["runs"]).mark_arc().encode(theta="count:Q", color="runs_batter:N"))
+    st.table(summary["runs"])
 
     # Wicket Types
     st.subheader("📊 Wicket Types")
-    wk_counts = ball_df["wicket_type"].value_counts().reset_index()
-    wk_counts.columns = ["wicket_type", "count"]
-    st.altair_chart(alt.Chart(wk_counts).mark_arc().encode(theta="count:Q", color="wicket_type:N"))
-    st.table(wk_counts)
+    st.altair_chart(alt.Chart(summary["wickets"]).mark_arc().encode(theta="count:Q", color="wicket_type:N"))
+    st.table(summary["wickets"])
 
     # Extras Types
     st.subheader("📊 Extras Types")
-    ex_counts = ball_df["extras_type"].value_counts().reset_index()
-    ex_counts.columns = ["extras_type", "count"]
-    st.altair_chart(alt.Chart(ex_counts).mark_arc().encode(theta="count:Q", color="extras_type:N"))
-    st.table(ex_counts)
+    st.altair_chart(alt.Chart(summary["extras"]).mark_arc().encode(theta="count:Q", color="extras_type:N"))
+    st.table(summary["extras"])
 
     # Totals
     st.subheader("📋 Totals")
-    totals = {
-        "Total Runs": ball_df["runs_total"].sum(),
-        "Total Wickets": ball_df["wicket_type"].notna().sum(),
-        "Total Extras": ball_df["runs_extras"].sum(),
-        "Total Balls": len(ball_df)
-    }
-    st.table(pd.DataFrame(totals.items(), columns=["Metric","Value"]))
+    st.table(summary["totals"])
 
+def render_player_leaders(leaders):
     # Top 10 Run Scorers
     st.subheader("🏏 Top 10 Run Scorers")
-    run_data = []
-    if os.path.exists(player_dir):
-        for pname in os.listdir(player_dir):
-            batter_csv = os.path.join(player_dir, pname, "batter.csv")
-            if os.path.exists(batter_csv):
-                df = load_csv(batter_csv)
-                if team: df = df[df["match_id"].isin(valid_match_ids)]
-                run_data.append((pname, df["runs_batter"].sum()))
-    run_df = pd.DataFrame(run_data, columns=["player","runs"]).sort_values("runs", ascending=False).head(10)
-    st.bar_chart(run_df.set_index("player")["runs"])
+    st.bar_chart(leaders["runs"].set_index("player")["runs"])
 
     # Top 10 Wicket Takers
     st.subheader("🎯 Top 10 Wicket Takers")
-    wk_data = []
-    if os.path.exists(player_dir):
-        for pname in os.listdir(player_dir):
-            bowler_csv = os.path.join(player_dir, pname, "bowler.csv")
-            if os.path.exists(bowler_csv):
-                df = load_csv(bowler_csv)
-                if team: df = df[df["match_id"].isin(valid_match_ids)]
-                wk_data.append((pname, df["wicket_type"].notna().sum()))
-    wk_df = pd.DataFrame(wk_data, columns=["player","wickets"]).sort_values("wickets", ascending=False).head(10)
-    st.bar_chart(wk_df.set_index("player")["wickets"])
+    st.bar_chart(leaders["wickets"].set_index("player")["wickets"])
 
     # Top 10 Fielders
     st.subheader("👐 Top 10 Fielders (Catches + Runouts)")
-    fld_data = []
-    if os.path.exists(player_dir):
-        for pname in os.listdir(player_dir):
-            fielder_csv = os.path.join(player_dir, pname, "fielder.csv")
-            if os.path.exists(fielder_csv):
-                df = load_csv(fielder_csv)
-                if team: df = df[df["match_id"].isin(valid_match_ids)]
-                catches = (df["wicket_type"]=="caught").sum()
-                runouts = (df["wicket_type"]=="run out").sum()
-                fld_data.append((pname, catches+runouts, catches, runouts))
-    fld_df = pd.DataFrame(fld_data, columns=["player","total","catches","runouts"]).sort_values("total", ascending=False).head(10)
-    st.bar_chart(fld_df.set_index("player")["total"])
-    st.table(fld_df)
+    st.bar_chart(leaders["fielders"].set_index("player")["total"])
+    st.table(leaders["fielders"])
 
+def render_toss_summary(toss):
     # Toss Analysis
-    if not info_df.empty:
-        st.subheader("🪙 Toss Wins by Team")
-        toss_counts = info_df["toss_winner"].value_counts().reset_index()
-        toss_counts.columns = ["team","count"]
-        st.bar_chart(toss_counts.set_index("team")["count"])
-        st.table(toss_counts)
-
-        st.subheader("🪙 Toss Decision (Bat/Field) by Team")
-        if "toss_winner" in info_df.columns and "toss_decision" in info_df.columns:
-            toss_decision_counts = info_df.groupby(["toss_winner","toss_decision"]).size().reset_index(name="count")
-            toss_chart = alt.Chart(toss_decision_counts).mark_bar().encode(
-                x="toss_winner:N", y="count:Q", color="toss_decision:N"
-            ).properties(title="Toss Decision by Team")
-            st.altair_chart(toss_chart, use_container_width=True)
-            st.table(toss_decision_counts)
+    if toss is None:
+        return
+    st.subheader("🪙 Toss Wins by Team")
+    st.bar_chart(toss["wins"].set_index("team")["count"])
+    st.table(toss["wins"])
 
+    st.subheader("🪙 Toss Decision (Bat/Field) by Team")
+    if toss["decisions"] is not None:
+        toss_chart = alt.Chart(toss["decisions"]).mark_bar().encode(
+            x="toss_winner:N", y="count:Q", color="toss_decision:N"
+        ).properties(title="Toss Decision by Team")
+        st.altair_chart(toss_chart, use_container_width=True)
+        st.table(toss["decisions"])
+
+def render_match_summary(matches):
     # Player of the Match
-    if not matches_df.empty and "player_of_match" in matches_df.columns:
+    if matches["pom"] is not None:
         st.subheader("🌟 Player of the Match Awards")
-        pom_counts = matches_df["player_of_match"].value_counts().reset_index()
-        pom_counts.columns = ["player","count"]
-        st.bar_chart(pom_counts.set_index("player")["count"].head(10))
-        st.table(pom_counts)
+        st.bar_chart(matches["pom"].head(10).set_index("player")["count"])
+        st.table(matches["pom"])
 
     # Match Winners
-    if not matches_df.empty and "outcome.winner" in matches_df.columns:
+    if matches["winners"] is not None:
         st.subheader("🏆 Match Winners")
-        win_counts = matches_df["outcome.winner"].value_counts().reset_index()
-        win_counts.columns = ["team","wins"]
-        st.bar_chart(win_counts.set_index("team")["wins"])
-        st.table(win_counts)
+        st.bar_chart(matches["winners"].set_index("team")["wins"])
+        st.table(matches["winners"])
 
-        if "outcome.by.wickets" in matches_df.columns or "outcome.by.runs" in matches_df.columns:
+        if matches["margins"] is not None:
             st.subheader("📋 Win Margins")
-            margin_df = matches_df[["outcome.winner","outcome.by.wickets","outcome.by.runs","outcome.result"]].dropna(how="all")
-            st.table(margin_df.head(20))  # preview only
+            st.table(matches["margins"])
+
+def show_dashboard(folder, title, team=None):
+    st.header(f"📊 {title}" + (f" - {team}" if team else ""))
+
+    # precomputed snapshot when available, live aggregation otherwise
+    version = etl_version(folder)
+    snapshot = load_snapshot(folder, team, version) or build_snapshot(folder, team, version)
+    if snapshot is None:
+        st.warning("No ball-by-ball data available for this selection.")
+        return
+
+    render_ball_summary(snapshot["ball"])
+    render_player_leaders(snapshot["leaders"])
+    render_toss_summary(snapshot["toss"])
+    render_match_summary(snapshot["matches"])
 
 # ---------- Streamlit UI ----------
-st.set_page_config(page_title="🏏 Cricket Dashboard 2001 to 2025", layout="wide")
-st.title("🏏 Cricket Dashboard 2001 to 2025")
+def main():
+    st.set_page_config(page_title="🏏 Cricket Dashboard 2001 to 2025", layout="wide")
+    st.title("🏏 Cricket Dashboard 2001 to 2025")
+
+    match_type = st.selectbox("Select Match Type", [""] + list(SUBFOLDERS.keys()), format_func=lambda x: SUBFOLDERS.get(x, ""))
+    team = st.selectbox("Select Team", [""] + (get_teams(match_type) if match_type else []))
+    player = st.selectbox("Select Player", [""] + (get_players(match_type, team) if match_type else []))
 
-match_type = st.selectbox("Select Match Type", [""] + list(SUBFOLDERS.keys()), format_func=lambda x: SUBFOLDERS.get(x, ""))
-team = st.selectbox("Select Team", [""] + (get_teams(match_type) if match_type else []))
-player = st.selectbox("Select Player", [""] + (get_players(match_type, team) if match_type else []))
+    # ---------- Default / Competition Views ----------
+    if not match_type and not team and not player:
+        show_dashboard("all_json", "All International Matches")
 
-# ---------- Default / Competition Views ----------
-if not match_type and not team and not player:
-    show_dashboard("all_json", "All International Matches")
+    elif match_type and not team and not player:
+        show_dashboard(match_type, SUBFOLDERS[match_type])
 
-elif match_type and not team and not player:
-    show_dashboard(match_type, SUBFOLDERS[match_type])
+    elif match_type and team and not player:
+        show_dashboard(match_type, SUBFOLDERS[match_type], team=team)
 
-elif match_type and team and not player:
-    show_dashboard(match_type, SUBFOLDERS[match_type], team=team)
+    elif match_type and team and player:
+        st.header(f"⭐ Player Analysis: {player} ({team}, {SUBFOLDERS[match_type]})")
+        st.info("Player-specific charts coming soon!")
 
-elif match_type and team and player:
-    st.header(f"⭐ Player Analysis: {player} ({team}, {SUBFOLDERS[match_type]})")
-    st.info("Player-specific charts coming soon!")
+# streamlit runs the app as __main__; scripts/precompute.py imports it for the aggregations
+if __name__ == "__main__":
+    main()
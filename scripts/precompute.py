@@ -0,0 +1,49 @@
+"""Precompute dashboard snapshots for every (folder, team) selection.
+
+Run from the repository root after the notebook ETL has written cricket/analysis:
+
+    python scripts/precompute.py [folder ...]
+
+The dashboard loads these snapshots instead of aggregating on each visit. Each one
+records the mtimes of the ETL outputs it was built from; after an ETL rerun the
+dashboard computes live until this script is run again.
+"""
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dashboard import BASE_PATH, SUBFOLDERS, build_snapshot, etl_version, get_teams, snapshot_path
+
+
+def write_snapshot(folder, team, version):
+    snapshot = build_snapshot(folder, team, version)
+    path = snapshot_path(folder, team)
+    if snapshot is None:
+        # no data for this selection; drop a stale snapshot so the dashboard shows the warning
+        if os.path.exists(path):
+            os.remove(path)
+        return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        # the ETL version is checked on load, so a stale snapshot falls back to live compute
+        pickle.dump({"version": version, "sections": snapshot}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return True
+
+
+def main(folders):
+    for folder in folders:
+        if not os.path.isdir(os.path.join(BASE_PATH, folder)):
+            print(f"skipping {folder}: no ETL output")
+            continue
+        written = 0
+        version = etl_version(folder)
+        for team in [None] + get_teams(folder):
+            written += write_snapshot(folder, team, version)
+        print(f"{folder}: {written} snapshots")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or list(SUBFOLDERS))